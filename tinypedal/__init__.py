@@ -23,6 +23,7 @@ Init
 import logging
 import os
 import sys
+from functools import lru_cache
 
 # Create logger
 logger = logging.getLogger(__package__)
@@ -70,11 +71,24 @@ def set_global_user_path(filepath: str, platform: str) -> str:
     if platform == "Windows":
         path = set_user_data_path(f"{os.getenv('APPDATA')}/{filepath}/")
     else:
-        from xdg import BaseDirectory as BD
-        path = BD.save_config_path(filepath) + "/"
+        path = set_xdg_config_path(filepath) + "/"
     return path
 
 
+@lru_cache(maxsize=None)
+def set_xdg_config_path(*resource: str) -> str:
+    """Set XDG user config path, create if not exist, cache result per resource"""
+    from xdg import BaseDirectory as BD
+    return BD.save_config_path(*resource)
+
+
+@lru_cache(maxsize=None)
+def set_xdg_data_path(*resource: str) -> str:
+    """Set XDG user data path, create if not exist, cache result per resource"""
+    from xdg import BaseDirectory as BD
+    return BD.save_data_path(*resource)
+
+
 def set_relative_path(filepath: str) -> str:
     """Convert absolute path to relative if path is inside APP root folder"""
     try:
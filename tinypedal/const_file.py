@@ -60,6 +60,7 @@ class FileExt:
     TXT = ".txt"
     INI = ".ini"
     BAK = ".bak"
+    TMP = ".tmp"
     JSON = ".json"
     # Image
     SVG = ".svg"
@@ -116,6 +116,7 @@ CFG_INTEGER = (
     "decimal_places|"
     "display_detail_level|"
     "display_height|"
+    "display_interval|"
     "display_margin|"
     "display_size|"
     "display_width|"
@@ -151,6 +152,7 @@ CFG_INVALID_FILENAME = (
     # Partial match
     "backup"
 )
+rex_invalid_filename = re.compile(CFG_INVALID_FILENAME, flags=re.IGNORECASE).search
 
 # API name
 API_NAME_RF2 = "rFactor 2"
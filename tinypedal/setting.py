@@ -25,8 +25,7 @@ from __future__ import annotations
 import logging
 import os
 import threading
-from collections import ChainMap
-from time import sleep
+from time import monotonic
 from types import MappingProxyType
 
 from . import set_user_data_path
@@ -54,6 +53,21 @@ from .validator import is_allowed_filename
 
 logger = logging.getLogger(__name__)
 
+# Read-only default setting, shared by all presets
+DEFAULT_CONFIG = MappingProxyType(GLOBAL_DEFAULT)
+DEFAULT_SETTING = MappingProxyType({**COMMON_DEFAULT, **MODULE_DEFAULT, **WIDGET_DEFAULT})
+DEFAULT_BRAKES = MappingProxyType(BRAKES_DEFAULT)
+DEFAULT_CLASSES = MappingProxyType(CLASSES_DEFAULT)
+DEFAULT_COMPOUNDS = MappingProxyType(COMPOUNDS_DEFAULT)
+DEFAULT_HEATMAP = MappingProxyType(HEATMAP_DEFAULT)
+DEFAULT_TRACKS = MappingProxyType(TRACKS_DEFAULT)
+DEFAULT_FILELOCK = MappingProxyType(FILELOCK_DEFAULT)
+
+# User path key & FilePath attribute name pairs
+USER_PATH_ATTRS = tuple(
+    (key, key.replace("_path", "")) for key in GLOBAL_DEFAULT["user_path"]
+)
+
 
 class FileName:
     """File name"""
@@ -115,13 +129,14 @@ class FilePath:
 
     def update(self, user_path: dict, default_path: dict):
         """Update path variables from global user path dictionary"""
-        for key in user_path.keys():
+        for key, attr_name in USER_PATH_ATTRS:
+            path = set_user_data_path(user_path[key])
             # Reset path if invalid
-            if not set_user_data_path(user_path[key]):
-                user_path[key] = default_path[key]
-                set_user_data_path(user_path[key])
+            if not path:
+                path = user_path[key] = default_path[key]
+                set_user_data_path(path)
             # Assign path
-            setattr(self, key.replace("_path", ""), user_path[key])
+            setattr(self, attr_name, path)
 
 
 class Preset:
@@ -141,24 +156,28 @@ class Preset:
 
     def set_default(self):
         """Set default setting"""
-        self.config = MappingProxyType(GLOBAL_DEFAULT)
-        self.setting = MappingProxyType(ChainMap(WIDGET_DEFAULT, MODULE_DEFAULT, COMMON_DEFAULT))
-        self.brakes = MappingProxyType(BRAKES_DEFAULT)
+        self.config = DEFAULT_CONFIG
+        self.setting = DEFAULT_SETTING
+        self.brakes = DEFAULT_BRAKES
         self.brands = EMPTY_DICT
-        self.classes = MappingProxyType(CLASSES_DEFAULT)
-        self.compounds = MappingProxyType(COMPOUNDS_DEFAULT)
-        self.heatmap = MappingProxyType(HEATMAP_DEFAULT)
-        self.tracks = MappingProxyType(TRACKS_DEFAULT)
-        self.filelock = MappingProxyType(FILELOCK_DEFAULT)
+        self.classes = DEFAULT_CLASSES
+        self.compounds = DEFAULT_COMPOUNDS
+        self.heatmap = DEFAULT_HEATMAP
+        self.tracks = DEFAULT_TRACKS
+        self.filelock = DEFAULT_FILELOCK
 
 
 class Setting:
     """Overlay setting"""
 
     __slots__ = (
-        "_save_delay",
+        "_save_deadline",
+        "_save_wake",
         "_save_queue",
         "_setting_to_load",
+        "_preset_list_cache",
+        "_save_done",
+        "_save_lock",
         "is_saving",
         "version_update",
         "filename",
@@ -175,9 +194,14 @@ class Setting:
 
     def __init__(self):
         # States
-        self._save_delay = 0
+        self._save_deadline = 0.0
+        self._save_wake = threading.Event()
         self._save_queue = {}
         self._setting_to_load = ""
+        self._preset_list_cache = None
+        self._save_done = threading.Event()
+        self._save_done.set()
+        self._save_lock = threading.Lock()
         self.is_saving = False
         self.version_update = 0
         # Settings
@@ -238,14 +262,13 @@ class Setting:
 
     def update_path(self):
         """Update global path, call this if "user_path" changed"""
-        old_settings_path = os.path.abspath(self.path.settings)
+        old_settings_path = self.path.settings
         self.path.update(
             user_path=self.user.config["user_path"],
             default_path=self.default.config["user_path"],
         )
-        new_settings_path = os.path.abspath(self.path.settings)
         # Update preset name if settings path changed
-        if new_settings_path != old_settings_path:
+        if self.path.settings != old_settings_path:
             self.set_next_to_load(f"{self.preset_list[0]}{FileExt.JSON}")
 
     def load(self):
@@ -310,19 +333,32 @@ class Setting:
         Returns:
             JSON filename (without file extension) list.
         """
-        gen_cfg_list = (
-            (os.path.getmtime(f"{self.path.settings}{_filename}"), _filename[:-5])
-            for _filename in os.listdir(self.path.settings)
-            if _filename.lower().endswith(FileExt.JSON)
-        )
+        # Reuse last scan result within short period if folder unchanged
+        dir_mtime = os.stat(self.path.settings).st_mtime_ns
+        cache = self._preset_list_cache
+        if (
+            cache is not None
+            and cache[0] == self.path.settings
+            and cache[1] == dir_mtime
+            and monotonic() - cache[2] < 0.2
+        ):
+            return cache[3].copy()
+        with os.scandir(self.path.settings) as entries:
+            cfg_list = [
+                (_entry.stat().st_mtime, _entry.name[:-5])
+                for _entry in entries
+                if _entry.name.lower().endswith(FileExt.JSON) and _entry.is_file()
+            ]
+        cfg_list.sort(reverse=True)
         valid_cfg_list = [
             _filename[1]
-            for _filename in sorted(gen_cfg_list, reverse=True)
+            for _filename in cfg_list
             if is_allowed_filename(_filename[1])
         ]
-        if valid_cfg_list:
-            return valid_cfg_list
-        return ["default"]
+        if not valid_cfg_list:
+            valid_cfg_list = ["default"]
+        self._preset_list_cache = (self.path.settings, dir_mtime, monotonic(), valid_cfg_list)
+        return valid_cfg_list.copy()
 
     def create(self, filename: str):
         """Create default setting"""
@@ -332,75 +368,99 @@ class Setting:
             filepath=self.path.settings,
             max_attempts=self.max_saving_attempts,
         )
+        self._preset_list_cache = None
 
-    def save(self, delay: int = 66, cfg_type: str = ConfigType.SETTING, next_task: bool = False):
+    def save(self, delay: int = 66, cfg_type: str = ConfigType.SETTING):
         """Save trigger, limit to one save operation for a given period.
 
         Args:
-            count:
-                Set time delay(count) that can be refreshed before starting saving thread.
+            delay:
+                Set time delay(in 10ms unit) that can be refreshed before starting saving.
                 Default is roughly one sec delay, use 0 for instant saving.
             cfg_type:
                 Set saving config type.
-            next_task:
-                Skip adding save task, run next save task in queue.
         """
-        if not next_task:
-            filename = getattr(self.filename, cfg_type, None)
-            # Check if valid file name
-            if filename is None:
-                logger.error("USERDATA: invalid config type %s, abort saving", cfg_type)
-            # Check if file is locked
-            elif filename in self.user.filelock:
-                logger.info("USERDATA: %s is locked, changes not saved", filename)
-            # Add to save queue
-            elif filename not in self._save_queue:
-                # Save to global config path
-                if cfg_type == ConfigType.CONFIG:
-                    filepath = self.path.config
-                elif cfg_type == ConfigType.FILELOCK:
-                    filepath = self.path.config
-                # Save to settings (preset) path
-                else:
-                    filepath = self.path.settings
-                dict_user = getattr(self.user, cfg_type)
-                self._save_queue[filename] = (filepath, dict_user)
-
-        for queue_filename, queue_filedata in self._save_queue.items():
-            break  # get next file in queue
-        else:
+        filename = getattr(self.filename, cfg_type, None)
+        # Check if valid file name
+        if filename is None:
+            logger.error("USERDATA: invalid config type %s, abort saving", cfg_type)
             return
+        # Check if file is locked
+        if filename in self.user.filelock:
+            logger.info("USERDATA: %s is locked, changes not saved", filename)
+            return
+        # Save to global config path
+        if cfg_type == ConfigType.CONFIG:
+            filepath = self.path.config
+        elif cfg_type == ConfigType.FILELOCK:
+            filepath = self.path.config
+        # Save to settings (preset) path
+        else:
+            filepath = self.path.settings
+        dict_user = getattr(self.user, cfg_type)
 
-        self._save_delay = delay
-
-        if not self.is_saving:
+        with self._save_lock:
+            # Add to save queue
+            if filename not in self._save_queue:
+                self._save_queue[filename] = (filepath, dict_user)
+            self._save_deadline = monotonic() + delay * 0.01
+            self._save_wake.set()
+            if self.is_saving:
+                return
             self.is_saving = True
-            threading.Thread(
-                target=self.__saving,
-                args=(queue_filename, *queue_filedata),
-            ).start()
-
-    def __saving(self, filename: str, filepath: str, dict_user: dict):
-        """Saving thread"""
-        # Update save delay
-        while self._save_delay > 0:
-            self._save_delay -= 1
-            sleep(0.01)
-
-        save_and_verify_json_file(
-            dict_user=dict_user,
-            filename=filename,
-            filepath=filepath,
-            max_attempts=self.max_saving_attempts,
-        )
-
-        self._save_queue.pop(filename, None)
-        self.is_saving = False
-        self.version_update += 1
+            self._save_done.clear()
+
+        threading.Thread(target=self.__saving).start()
+
+    def __saving(self):
+        """Saving thread, save all tasks in queue"""
+        finished = False
+        try:
+            while True:
+                # Wait until save deadline, deadline can be extended while waiting
+                while True:
+                    self._save_wake.clear()
+                    remaining = self._save_deadline - monotonic()
+                    if remaining <= 0:
+                        break
+                    self._save_wake.wait(remaining)
+
+                # Take next task out of queue, so new changes to same file can be queued again
+                with self._save_lock:
+                    if not self._save_queue:
+                        self.is_saving = False
+                        self._save_done.set()
+                        finished = True
+                        return
+                    filename = next(iter(self._save_queue))
+                    filepath, dict_user = self._save_queue.pop(filename)
+
+                save_and_verify_json_file(
+                    dict_user=dict_user,
+                    filename=filename,
+                    filepath=filepath,
+                    max_attempts=self.max_saving_attempts,
+                )
+                self._preset_list_cache = None
+                self.version_update += 1
+        finally:
+            # Reset saving state if stopped by unexpected error,
+            # remaining tasks in queue are saved on next save call
+            if not finished:
+                with self._save_lock:
+                    self.is_saving = False
+                    self._save_done.set()
+
+    def wait_saving(self, timeout: float = 5.0) -> bool:
+        """Wait until all save tasks in queue finished, or timeout (seconds)
 
-        # Run next save task in save queue if any
-        if self._save_queue:
-            self.save(0, next_task=True)
+        Returns:
+            True if saving finished, False if timed out.
+        """
+        if self._save_done.wait(timeout):
+            return True
+        logger.error("USERDATA: saving not finished after %ss, continue", timeout)
+        return False
 
     @property
     def max_saving_attempts(self) -> int:
@@ -232,6 +232,6 @@ class PresetValidator:
         # Check top-level key
         cls.validate_key_pair(dict_user, dict_def)
         # Check sub-level key
-        for item in dict_user.keys():  # list each key lists
-            cls.validate_key_pair(dict_user[item], dict_def[item])
+        for item, sub_dict_user in dict_user.items():  # list each key lists
+            cls.validate_key_pair(sub_dict_user, dict_def[item])
         return dict_user
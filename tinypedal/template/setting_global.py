@@ -20,6 +20,7 @@
 Default global (config) setting template
 """
 
+from .. import set_xdg_config_path, set_xdg_data_path
 from ..const_app import APP_NAME, PLATFORM
 
 GLOBAL_DEFAULT = {
@@ -139,8 +140,6 @@ def _set_platform_default(global_def: dict):
         global_def["compatibility"]["enable_bypass_window_manager"] = True
         global_def["compatibility"]["enable_x11_platform_plugin_override"] = True
         # Global path
-        from xdg import BaseDirectory as BD
-
         config_paths = (
             "settings_path",
             "brand_logo_path",
@@ -150,9 +149,9 @@ def _set_platform_default(global_def: dict):
         user_path = global_def["user_path"]
         for key, path in user_path.items():
             if key in config_paths:
-                user_path[key] = BD.save_config_path(APP_NAME, path)
+                user_path[key] = set_xdg_config_path(APP_NAME, path)
             else:
-                user_path[key] = BD.save_data_path(APP_NAME, path)
+                user_path[key] = set_xdg_data_path(APP_NAME, path)
 
 
 _set_platform_default(GLOBAL_DEFAULT)
@@ -188,6 +188,7 @@ WIDGET_DEFAULT = {
     "brake_wear": {
         "enable": False,
         "update_interval": 20,
+        "display_interval": 33,
         "position_x": 688,
         "position_y": 720,
         "opacity": 0.9,
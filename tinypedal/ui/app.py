@@ -21,7 +21,6 @@ Main application window
 """
 
 import logging
-import time
 
 from PySide2.QtCore import Qt, Slot
 from PySide2.QtWidgets import (
@@ -196,8 +195,7 @@ class StatusButtonBar(QStatusBar):
         cfg.application["enable_high_dpi_scaling"] = not cfg.application["enable_high_dpi_scaling"]
         cfg.save(0, cfg_type=ConfigType.CONFIG)
         # Wait saving finish
-        while cfg.is_saving:
-            time.sleep(0.01)
+        cfg.wait_saving()
         self.refresh()
         self._parent.quit_app()
         loader.restart()
@@ -215,6 +213,8 @@ class StatusButtonBar(QStatusBar):
 class AppWindow(QMainWindow):
     """Main application window"""
 
+    TRAY_DOUBLECLICK = QSystemTrayIcon.ActivationReason.DoubleClick
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle(f"{APP_NAME} v{VERSION}")
@@ -277,7 +277,7 @@ class AppWindow(QMainWindow):
 
     def tray_doubleclick(self, active_reason: QSystemTrayIcon.ActivationReason):
         """Tray doubleclick"""
-        if active_reason == QSystemTrayIcon.ActivationReason.DoubleClick:
+        if active_reason == self.TRAY_DOUBLECLICK:
             self.show_app()
 
     def set_window_state(self):
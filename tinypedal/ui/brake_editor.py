@@ -21,7 +21,6 @@ Brake editor
 """
 
 import logging
-import time
 
 from PySide2.QtWidgets import (
     QComboBox,
@@ -245,7 +244,6 @@ class BrakeEditor(BaseEditor):
         self.update_brakes_temp()
         cfg.user.brakes = copy_setting(self.brakes_temp)
         cfg.save(0, cfg_type=ConfigType.BRAKES)
-        while cfg.is_saving:  # wait saving finish
-            time.sleep(0.01)
+        cfg.wait_saving()
         self.reloading()
         self.set_unmodified()
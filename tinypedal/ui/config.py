@@ -21,7 +21,6 @@ Config dialog
 """
 
 import re
-import time
 from typing import Callable
 
 from PySide2.QtCore import QPoint, Qt
@@ -141,8 +140,7 @@ class FontConfig(BaseDialog):
                     continue
         self.edit_fontsize.setValue(0)
         cfg.save(0)
-        while cfg.is_saving:  # wait saving finish
-            time.sleep(0.01)
+        cfg.wait_saving()
         self.reloading()
 
 
@@ -333,8 +331,7 @@ class UserConfig(BaseDialog):
         else:
             cfg.save(0)
         # Wait saving finish
-        while cfg.is_saving:
-            time.sleep(0.01)
+        cfg.wait_saving()
         # Reload
         self.reloading()
         # Close
@@ -20,8 +20,6 @@
 Heatmap editor
 """
 
-import time
-
 from PySide2.QtWidgets import (
     QComboBox,
     QDialogButtonBox,
@@ -328,8 +326,7 @@ class HeatmapEditor(BaseEditor):
         self.update_heatmap_temp()
         cfg.user.heatmap = copy_setting(self.heatmap_temp)
         cfg.save(0, cfg_type=ConfigType.HEATMAP)
-        while cfg.is_saving:  # wait saving finish
-            time.sleep(0.01)
+        cfg.wait_saving()
         self.reloading()
         self.set_unmodified()
 
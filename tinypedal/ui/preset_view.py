@@ -20,6 +20,8 @@
 Preset list view
 """
 
+from __future__ import annotations
+
 import os
 import shutil
 from typing import Callable
@@ -48,6 +50,8 @@ from ..validator import is_allowed_filename
 from ._common import QVAL_FILENAME, BaseDialog, UIScaler
 from .preset_transfer import PresetTransfer
 
+EMPTY_TAG = ((), "")
+
 
 class PresetList(QWidget):
     """Preset list view"""
@@ -56,6 +60,8 @@ class PresetList(QWidget):
         super().__init__(parent)
         self.reload_preset = reload_func
         self.notify_toggle = notify_toggle
+        self._preset_names = []
+        self._preset_tags = []
 
         # Label
         self.label_loaded = QLabel("")
@@ -102,16 +108,38 @@ class PresetList(QWidget):
     def refresh(self):
         """Refresh preset list"""
         preset_list = cfg.preset_list
-        self.listbox_preset.clear()
 
-        for preset_name in preset_list:
-            # Add preset name
-            item = QListWidgetItem()
-            item.setText(preset_name)
-            self.listbox_preset.addItem(item)
-            # Add primary preset tag
-            label_item = PresetTagItem(self, preset_name)
-            self.listbox_preset.setItemWidget(item, label_item)
+        # Rebuild list only if preset names or order changed
+        if self._preset_names != preset_list:
+            self._preset_names = preset_list
+            self._preset_tags = [EMPTY_TAG] * len(preset_list)
+            self.listbox_preset.clear()
+            for preset_name in preset_list:
+                item = QListWidgetItem()
+                item.setText(preset_name)
+                self.listbox_preset.addItem(item)
+
+        # Map primary preset name to sim names
+        primary_tags = {}
+        for sim_name, primary_preset in cfg.primary_preset.items():
+            if primary_preset:
+                primary_tags[primary_preset] = primary_tags.get(primary_preset, ()) + (sim_name,)
+
+        # Update primary preset & locked tag only if changed
+        for row_index, preset_name in enumerate(preset_list):
+            sim_names = primary_tags.get(preset_name, ())
+            locked_info = cfg.user.filelock.get(f"{preset_name}{FileExt.JSON}")
+            locked_version = f"{locked_info['version']}" if locked_info else ""
+            tag = (sim_names, locked_version)
+            if self._preset_tags[row_index] == tag:
+                continue
+            self._preset_tags[row_index] = tag
+            item = self.listbox_preset.item(row_index)
+            if tag == EMPTY_TAG:
+                self.listbox_preset.removeItemWidget(item)
+            else:
+                label_item = PresetTagItem(self, sim_names, locked_version)
+                self.listbox_preset.setItemWidget(item, label_item)
 
         loaded_preset = cfg.filename.setting
         is_locked = loaded_preset in cfg.user.filelock
@@ -237,8 +265,9 @@ class PresetList(QWidget):
                 "This cannot be undone!"
             )
             if self.confirm_operation(title="Delete Preset", message=msg_text):
-                if os.path.exists(f"{cfg.path.settings}{selected_filename}"):
-                    os.remove(f"{cfg.path.settings}{selected_filename}")
+                selected_filepath = f"{cfg.path.settings}{selected_filename}"
+                if os.path.exists(selected_filepath):
+                    os.remove(selected_filepath)
                 self.refresh()
 
     def confirm_operation(self, title: str = "Confirm", message: str = "") -> bool:
@@ -300,33 +329,34 @@ class CreatePreset(BaseDialog):
     def __saving(self, filepath: str, entered_filename: str, source_filename: str):
         """Saving new preset"""
         # Check existing preset
-        temp_list = cfg.preset_list
-        for preset in temp_list:
-            if entered_filename.lower() == preset.lower():
+        entered_name_lower = entered_filename.lower()
+        for preset in cfg.preset_list:
+            if entered_name_lower == preset.lower():
                 QMessageBox.warning(self, "Error", "Preset already exists.")
                 return
+        target_filename = f"{entered_filename}{FileExt.JSON}"
         # Duplicate preset
         if self.edit_mode == "duplicate":
             shutil.copy(
                 f"{filepath}{source_filename}",
-                f"{filepath}{entered_filename}{FileExt.JSON}"
+                f"{filepath}{target_filename}"
             )
             self._parent.refresh()
         # Rename preset
         elif self.edit_mode == "rename":
             os.rename(
                 f"{filepath}{source_filename}",
-                f"{filepath}{entered_filename}{FileExt.JSON}"
+                f"{filepath}{target_filename}"
             )
             # Reload if renamed file was loaded
             if cfg.is_loaded(source_filename):
-                cfg.set_next_to_load(f"{entered_filename}{FileExt.JSON}")
+                cfg.set_next_to_load(target_filename)
                 self._parent.reload_preset()
             else:
                 self._parent.refresh()
         # Create new preset
         else:
-            cfg.create(f"{entered_filename}{FileExt.JSON}")
+            cfg.create(target_filename)
             self._parent.refresh()
         # Close window
         self.accept()
@@ -335,23 +365,24 @@ class CreatePreset(BaseDialog):
 class PresetTagItem(QWidget):
     """Preset tag item"""
 
-    def __init__(self, parent, preset_name: str):
+    def __init__(self, parent, sim_names: tuple[str, ...], locked_version: str):
         super().__init__(parent)
         layout_item = QHBoxLayout()
         layout_item.setContentsMargins(0, 0, 0, 0)
         layout_item.setSpacing(0)
         layout_item.addStretch(1)
 
-        for sim_name, primary_preset in cfg.primary_preset.items():
-            if preset_name == primary_preset:
-                label_sim_name = QLabel(sim_name)
-                label_sim_name.setObjectName(sim_name)
-                layout_item.addWidget(label_sim_name)
+        for sim_name in sim_names:
+            layout_item.addWidget(self.create_tag(sim_name, sim_name))
 
-        preset_filename = f"{preset_name}{FileExt.JSON}"
-        if preset_filename in cfg.user.filelock:
-            label_locked = QLabel(f"{cfg.user.filelock[preset_filename]['version']}")
-            label_locked.setObjectName("LOCKED")
-            layout_item.addWidget(label_locked)
+        if locked_version:
+            layout_item.addWidget(self.create_tag(locked_version, "LOCKED"))
 
         self.setLayout(layout_item)
+
+    @staticmethod
+    def create_tag(text: str, tag_name: str) -> QLabel:
+        """Create tag label, styled by tag name (object name) from global style sheet"""
+        label_tag = QLabel(text)
+        label_tag.setObjectName(tag_name)
+        return label_tag
@@ -21,7 +21,6 @@ Track info editor
 """
 
 import logging
-import time
 
 from PySide2.QtWidgets import (
     QHBoxLayout,
@@ -213,7 +212,6 @@ class TrackInfoEditor(BaseEditor):
         self.update_tracks_temp()
         cfg.user.tracks = copy_setting(self.tracks_temp)
         cfg.save(0, cfg_type=ConfigType.TRACKS)
-        while cfg.is_saving:  # wait saving finish
-            time.sleep(0.01)
+        cfg.wait_saving()
         self.reloading()
         self.set_unmodified()
@@ -21,7 +21,6 @@ Tyre compound editor
 """
 
 import logging
-import time
 
 from PySide2.QtWidgets import (
     QComboBox,
@@ -254,7 +253,6 @@ class TyreCompoundEditor(BaseEditor):
         self.update_compounds_temp()
         cfg.user.compounds = copy_setting(self.compounds_temp)
         cfg.save(0, cfg_type=ConfigType.COMPOUNDS)
-        while cfg.is_saving:  # wait saving finish
-            time.sleep(0.01)
+        cfg.wait_saving()
         self.reloading()
         self.set_unmodified()
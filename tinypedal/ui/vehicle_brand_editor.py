@@ -24,7 +24,6 @@ import asyncio
 import json
 import logging
 import os
-import time
 
 from PySide2.QtWidgets import (
     QFileDialog,
@@ -308,8 +307,7 @@ class VehicleBrandEditor(BaseEditor):
         self.update_brands_temp()
         cfg.user.brands = copy_setting(self.brands_temp)
         cfg.save(0, cfg_type=ConfigType.BRANDS)
-        while cfg.is_saving:  # wait saving finish
-            time.sleep(0.01)
+        cfg.wait_saving()
         self.reloading()
         self.set_unmodified()
 
@@ -21,7 +21,6 @@ Vehicle class editor
 """
 
 import random
-import time
 
 from PySide2.QtWidgets import (
     QHBoxLayout,
@@ -215,7 +214,6 @@ class VehicleClassEditor(BaseEditor):
         self.update_classes_temp()
         cfg.user.classes = copy_setting(self.classes_temp)
         cfg.save(0, cfg_type=ConfigType.CLASSES)
-        while cfg.is_saving:  # wait saving finish
-            time.sleep(0.01)
+        cfg.wait_saving()
         self.reloading()
         self.set_unmodified()
@@ -24,8 +24,10 @@ from __future__ import annotations
 
 import json
 import logging
+import mmap
 import os
 import shutil
+from hashlib import blake2b
 from time import localtime, monotonic, sleep, strftime
 from typing import Callable
 
@@ -34,6 +36,16 @@ from ..setting_validator import PresetValidator
 
 logger = logging.getLogger(__name__)
 
+try:  # optional faster json library
+    import orjson
+except ImportError:
+    orjson = None
+
+# Loaded json cache, key = full file path, value = (mtime_ns, size, dict_def, dict_user)
+_json_cache: dict[str, tuple[int, int, dict, dict]] = {}
+# Saved json digest, key = full file path, value = (mtime_ns, size, digest)
+_saved_digest: dict[str, tuple[int, int, bytes]] = {}
+
 
 def set_backup_timestamp(prefix: str = ".backup-", timestamp: bool = True) -> str:
     """Set backup timestamp"""
@@ -53,16 +65,59 @@ def copy_setting(dict_user: dict) -> dict:
     return dict_user.copy()
 
 
+def load_json_cache(filename_source: str, dict_def: dict) -> dict | None:
+    """Load cached json setting copy if file unchanged since last load"""
+    cache = _json_cache.get(filename_source)
+    if cache is None:
+        return None
+    try:
+        file_stat = os.stat(filename_source)
+    except OSError:
+        return None
+    if (
+        cache[0] == file_stat.st_mtime_ns
+        and cache[1] == file_stat.st_size
+        and cache[2] is dict_def
+    ):
+        return copy_setting(cache[3])
+    return None
+
+
+def update_json_cache(
+    filename_source: str, dict_def: dict, dict_user: dict, is_copy: bool = False
+) -> None:
+    """Update json setting cache with file stat of current file
+
+    Args:
+        is_copy: whether dict_user is already a private copy that can be cached as is.
+    """
+    try:
+        file_stat = os.stat(filename_source)
+    except OSError:
+        _json_cache.pop(filename_source, None)
+        return
+    _json_cache[filename_source] = (
+        file_stat.st_mtime_ns,
+        file_stat.st_size,
+        dict_def,
+        dict_user if is_copy else copy_setting(dict_user),
+    )
+
+
 def load_setting_json_file(
     filename: str, filepath: str, dict_def: dict, file_info: str = "user preset"
 ) -> dict:
     """Load setting json file & verify"""
     filename_source = f"{filepath}{filename}"
+    setting_user = load_json_cache(filename_source, dict_def)
+    if setting_user is not None:
+        logger.info("USERDATA: %s loaded (%s, cached)", filename, file_info)
+        return setting_user
     try:
-        with open(filename_source, "r", encoding="utf-8") as jsonfile:
-            setting_user = json.load(jsonfile)
+        setting_user = read_json_file(filename_source)
         # Verify & assign setting
         setting_user = PresetValidator.validate(setting_user, dict_def)
+        update_json_cache(filename_source, dict_def, setting_user)
     except FileNotFoundError:
         logger.info("USERDATA: %s not found, fall back to default", filename)
         setting_user = copy_setting(dict_def)
@@ -82,10 +137,13 @@ def load_style_json_file(
 ) -> dict:
     """Load style json file & verify (optional)"""
     filename_source = f"{filepath}{filename}"
+    style_user = load_json_cache(filename_source, dict_def)
+    if style_user is not None:
+        logger.info("USERDATA: %s loaded (%s, cached)", filename, file_info)
+        return style_user
     msg_text = "loaded"
     try:
-        with open(filename_source, "r", encoding="utf-8") as jsonfile:
-            style_user = json.load(jsonfile)
+        style_user = read_json_file(filename_source)
         # Whether to check and add missing style
         if check_missing:
             if PresetValidator.add_missing_key(tuple(dict_def), style_user, dict_def):
@@ -107,34 +165,140 @@ def load_style_json_file(
 
     if msg_text == "updated":
         save_json_file(style_user, filename, filepath)
+    update_json_cache(filename_source, dict_def, style_user)
 
     logger.info("USERDATA: %s %s (%s)", filename, msg_text, file_info)
     return style_user
 
 
+def deserialize_json(json_bytes: bytes) -> dict:
+    """Deserialize json bytes to dictionary"""
+    if orjson is not None:
+        try:
+            return orjson.loads(json_bytes)
+        except orjson.JSONDecodeError:
+            pass  # retry with json, which also accepts NaN & Infinity
+    return json.loads(json_bytes)
+
+
+def read_json_file(filename_source: str) -> dict:
+    """Read json file to dictionary, parse from memory-mapped file if possible"""
+    with open(filename_source, "rb") as jsonfile:
+        if orjson is not None:
+            try:
+                json_map = mmap.mmap(jsonfile.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):  # empty file or unsupported file system
+                json_map = None
+            if json_map is not None:
+                with json_map, memoryview(json_map) as json_view:
+                    try:
+                        return orjson.loads(json_view)
+                    except orjson.JSONDecodeError:
+                        # Retry with json, which also accepts NaN & Infinity
+                        return json.loads(bytes(json_view))
+        return deserialize_json(jsonfile.read())
+
+
+def serialize_json(dict_user: dict, compact_json: bool = False) -> bytes:
+    """Serialize dictionary to json bytes"""
+    if orjson is not None:
+        if compact_json:
+            return orjson.dumps(dict_user, option=orjson.OPT_NON_STR_KEYS)
+        return orjson.dumps(dict_user, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    if compact_json:
+        return json.dumps(dict_user, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return json.dumps(dict_user, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def save_json_bytes(
+    json_bytes: bytes, filename: str, filepath: str, extension: str = "", verify: bool = False
+) -> bool:
+    """Save serialized json bytes to file
+
+    Write to temporary file first, then replace target file,
+    so existing file is kept intact if writing or verification failed.
+    Symlink is resolved to write to linked file, and file mode of
+    existing file is kept. Read-only file is not overwritten.
+
+    Returns:
+        True if target file replaced, False if verification failed.
+
+    Raises:
+        PermissionError: if existing file is read-only.
+    """
+    filename_source = os.path.realpath(f"{filepath}{filename}{extension}")
+    filename_temp = f"{filename_source}{FileExt.TMP}"
+    file_exists = os.path.exists(filename_source)
+    if file_exists and not os.access(filename_source, os.W_OK):
+        raise PermissionError(f"no write permission {filename_source}")
+    replaced = False
+    try:
+        with open(filename_temp, "wb") as jsonfile:
+            jsonfile.write(json_bytes)
+            jsonfile.flush()
+            os.fsync(jsonfile.fileno())
+        if file_exists:
+            shutil.copymode(filename_source, filename_temp)
+        if verify and not verify_json_bytes(json_bytes, filename_temp, ""):
+            return False
+        os.replace(filename_temp, filename_source)
+        replaced = True
+        return True
+    finally:
+        if not replaced:
+            remove_temp_file(filename_temp)
+
+
+def remove_temp_file(filename_temp: str) -> None:
+    """Remove leftover temporary file"""
+    try:
+        os.remove(filename_temp)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        logger.error("USERDATA: unable to remove %s", filename_temp)
+
+
 def save_json_file(
     dict_user: dict, filename: str, filepath: str, extension: str = "", compact_json: bool = False
 ) -> None:
     """Save json file"""
-    filename_source = f"{filepath}{filename}{extension}"
-    with open(filename_source, "w", encoding="utf-8") as jsonfile:
-        if compact_json:
-            json.dump(dict_user, jsonfile, separators=(",", ":"))
-        else:
-            json.dump(dict_user, jsonfile, indent=4)
+    save_json_bytes(serialize_json(dict_user, compact_json), filename, filepath, extension)
 
 
-def verify_json_file(
-    dict_user: dict, filename: str, filepath: str, extension: str = ""
+def is_unchanged_json_file(filename_source: str, digest: bytes) -> bool:
+    """Check if json file is unchanged since last save with same content digest"""
+    saved = _saved_digest.get(filename_source)
+    if saved is None or saved[2] != digest:
+        return False
+    try:
+        file_stat = os.stat(filename_source)
+    except OSError:
+        return False
+    return saved[0] == file_stat.st_mtime_ns and saved[1] == file_stat.st_size
+
+
+def update_saved_digest(filename_source: str, digest: bytes) -> None:
+    """Update saved json digest with file stat of current file"""
+    try:
+        file_stat = os.stat(filename_source)
+    except OSError:
+        _saved_digest.pop(filename_source, None)
+        return
+    _saved_digest[filename_source] = (file_stat.st_mtime_ns, file_stat.st_size, digest)
+
+
+def verify_json_bytes(
+    json_bytes: bytes, filename: str, filepath: str, extension: str = ""
 ) -> bool:
-    """Verify saved json file"""
+    """Verify saved json file against serialized json bytes"""
     filename_source = f"{filepath}{filename}{extension}"
     try:
-        with open(filename_source, "r", encoding="utf-8") as jsonfile:
-            return json.load(jsonfile) == dict_user
+        with open(filename_source, "rb") as jsonfile:
+            return jsonfile.read() == json_bytes
     except FileNotFoundError:
         logger.error("USERDATA: not found %s", filename_source)
-    except (ValueError, OSError):
+    except OSError:
         logger.error("USERDATA: unable to verify %s", filename_source)
     return False
 
@@ -159,62 +323,6 @@ def create_backup_file(
     return False
 
 
-def restore_backup_file(
-    filename: str, filepath: str, extension: str = FileExt.BAK
-) -> bool:
-    """Restore backup file if saving failed"""
-    filename_backup = f"{filepath}{filename}{extension}"
-    filename_source = f"{filepath}{filename}"
-    try:
-        shutil.copyfile(filename_backup, filename_source)
-        logger.info("USERDATA: backup restored %s", filename_source)
-        return True
-    except FileNotFoundError:
-        logger.error("USERDATA: backup not found %s", filename_backup)
-    except PermissionError:
-        logger.error("USERDATA: no permission to access backup %s", filename_backup)
-    except OSError:
-        logger.error("USERDATA: unable to restore backup %s", filename_backup)
-    return False
-
-
-def copy_and_rename_backup_file(
-    filename: str, filepath: str, extension: str = FileExt.BAK
-) -> bool:
-    """Copy and rename backup file if restoring backup failed"""
-    filename_backup = f"{filepath}{filename}{extension}"
-    filename_renamed = f"{filepath}{filename}{set_backup_timestamp()}"
-    try:
-        shutil.copyfile(filename_backup, filename_renamed)
-        logger.info("USERDATA: backup renamed %s", filename_renamed)
-        return True
-    except FileNotFoundError:
-        logger.error("USERDATA: backup not found %s", filename_backup)
-    except PermissionError:
-        logger.error("USERDATA: no permission to access backup %s", filename_backup)
-    except OSError:
-        logger.error("USERDATA: unable to copy and rename backup %s", filename_backup)
-    return False
-
-
-def delete_backup_file(
-    filename: str, filepath: str, extension: str = FileExt.BAK
-) -> bool:
-    """Delete backup file"""
-    filename_backup = f"{filepath}{filename}{extension}"
-    try:
-        if os.path.exists(filename_backup):
-            os.remove(filename_backup)
-        return True
-    except FileNotFoundError:
-        logger.error("USERDATA: backup not found %s", filename_backup)
-    except PermissionError:
-        logger.error("USERDATA: no permission to access backup %s", filename_backup)
-    except OSError:
-        logger.error("USERDATA: unable to delete backup %s", filename_backup)
-    return False
-
-
 def save_and_verify_json_file(
     dict_user: dict,
     filename: str,
@@ -222,39 +330,47 @@ def save_and_verify_json_file(
     max_attempts: int = 10,
     compact_json: bool = False,
 ) -> None:
-    """Save and verify json file, backup or restore if saving failed"""
-    file_found = os.path.exists(f"{filepath}{filename}")
-    # Create backup: abort saving if backup failed; skip backup and create new if not exist
-    if not file_found:
-        logger.info("USERDATA: %s not found, create new", filename)
-    elif not create_backup_file(filename, filepath):
-        logger.info("USERDATA: %s saving abort", filename)
+    """Save and verify json file, keep existing file intact if saving failed"""
+    filename_source = f"{filepath}{filename}"
+    # Snapshot setting, so saved file and cache match even if setting changed while saving
+    dict_saved = copy_setting(dict_user)
+    json_bytes = serialize_json(dict_saved, compact_json)
+    digest = blake2b(json_bytes, digest_size=16).digest()
+    # Skip saving if same content already saved and file not modified since
+    if is_unchanged_json_file(filename_source, digest):
+        logger.info("USERDATA: %s unchanged, skip saving", filename)
         return
+    if not os.path.exists(filename_source):
+        logger.info("USERDATA: %s not found, create new", filename)
     # Start saving attempts
     attempts = max_attempts
     timer_start = monotonic()
     while attempts > 0:
-        save_json_file(dict_user, filename, filepath, compact_json=compact_json)
-        if verify_json_file(dict_user, filename, filepath):
-            break
+        try:
+            if save_json_bytes(json_bytes, filename, filepath, verify=True):
+                break
+        except OSError:
+            logger.error("USERDATA: unable to write %s", filename_source)
         attempts -= 1
         logger.error("USERDATA: %s failed saving, %s attempt(s) left", filename, attempts)
         sleep(0.05)
-    timer_end = round((monotonic() - timer_start) * 1000)
+    timer_end = monotonic()
     # Clean up
     if attempts > 0:
         state_text = "saved"
+        update_saved_digest(filename_source, digest)
+        cache = _json_cache.get(filename_source)
+        if cache is not None:
+            update_json_cache(filename_source, cache[2], dict_saved, is_copy=True)
     else:
-        if file_found and not restore_backup_file(filename, filepath):
-            copy_and_rename_backup_file(filename, filepath)
+        _saved_digest.pop(filename_source, None)
         state_text = "failed saving"
-    if file_found:
-        delete_backup_file(filename, filepath)
-    logger.info(
-        "USERDATA: %s %s (took %sms, %s/%s attempts)",
-        filename,
-        state_text,
-        timer_end,
-        max_attempts - attempts,
-        attempts,
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "USERDATA: %s %s (took %sms, %s/%s attempts)",
+            filename,
+            state_text,
+            round((timer_end - timer_start) * 1000),
+            max_attempts - attempts,
+            attempts,
+        )
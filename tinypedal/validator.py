@@ -24,7 +24,6 @@ from __future__ import annotations
 
 import logging
 import os
-import re
 import time
 from functools import wraps
 from math import isfinite
@@ -32,7 +31,7 @@ from typing import Any, Sequence
 
 from .const_common import MAX_SECONDS
 from .const_file import FileExt
-from .regex_pattern import CFG_INVALID_FILENAME, rex_hex_color
+from .regex_pattern import rex_hex_color, rex_invalid_filename
 
 logger = logging.getLogger(__name__)
 
@@ -65,7 +64,7 @@ def bytes_to_str(bytestring: bytes | Any, char_encoding: str = "utf-8") -> str:
 
 def is_allowed_filename(filename: str) -> bool:
     """Is allowed setting file name"""
-    return re.search(CFG_INVALID_FILENAME, filename, flags=re.IGNORECASE) is None
+    return rex_invalid_filename(filename) is None
 
 
 def invalid_save_name(name: str) -> bool:
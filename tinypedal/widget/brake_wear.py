@@ -20,6 +20,8 @@
 Brake Wear Widget
 """
 
+from time import monotonic
+
 from .. import calculation as calc
 from ..const_common import TEXT_NA
 from ..module_info import minfo
@@ -42,226 +44,300 @@ class Realtime(Overlay):
         # Config variable
         bar_padx = self.set_padding(self.wcfg["font_size"], self.wcfg["bar_padding"])
         bar_width = font_m.width * 4 + bar_padx
-        self.threshold_remaining = min(max(self.wcfg["warning_threshold_remaining"], 0), 100) * 0.01
+        self.show_thickness = self.wcfg["show_thickness"]
+        show_remaining = self.wcfg["show_remaining"]
+        show_wear_diff = self.wcfg["show_wear_difference"]
+        show_laps = self.wcfg["show_lifespan_laps"]
+        show_mins = self.wcfg["show_lifespan_minutes"]
+        self.threshold_remaining = min(max(self.wcfg["warning_threshold_remaining"], 0), 100)
+        self.threshold_wear = self.wcfg["warning_threshold_wear"]
+        self.threshold_laps = self.wcfg["warning_threshold_laps"]
+        self.threshold_mins = self.wcfg["warning_threshold_minutes"]
+        self.last_snapshot = None
+        self.last_max_thickness = None
+        self.thickness_scale = (1.0,) * 4
+        self.thresholds_remaining = (self.threshold_remaining,) * 4
+        self.display_interval = max(self.wcfg["display_interval"], 0) * 0.001
+        self.last_display_time = 0.0
+
+        # Reuse style sheet string for identical style between metric groups
+        qss_cache = {}
+
+        def cached_qss(**style):
+            key = tuple(sorted(style.items()))
+            qss = qss_cache.get(key)
+            if qss is None:
+                qss = qss_cache[key] = self.set_qss(**style)
+            return qss
 
         # Base style
-        self.setStyleSheet(self.set_qss(
+        self.setStyleSheet(cached_qss(
             font_family=self.wcfg["font_name"],
             font_size=self.wcfg["font_size"],
             font_weight=self.wcfg["font_weight"])
         )
-        bar_style_desc = self.set_qss(
+        bar_style_desc = cached_qss(
             fg_color=self.wcfg["font_color_caption"],
             bg_color=self.wcfg["bkg_color_caption"],
             font_size=int(self.wcfg['font_size'] * 0.8)
         )
+        # Enabled metrics, list of (bars, metric method)
+        self.active_metrics = []
 
         # Remaining brake thickness
-        if self.wcfg["show_remaining"]:
+        if show_remaining:
             layout_remain = self.set_grid_layout()
-            self.bar_style_remain = (
-                self.set_qss(
+            bar_style_remain = (
+                cached_qss(
                     fg_color=self.wcfg["font_color_remaining"],
                     bg_color=self.wcfg["bkg_color_remaining"]),
-                self.set_qss(
+                cached_qss(
                     fg_color=self.wcfg["font_color_warning"],
                     bg_color=self.wcfg["bkg_color_remaining"])
             )
             self.bars_remain = self.set_qlabel(
                 text=TEXT_NA,
-                style=self.bar_style_remain[0],
+                style=bar_style_remain[0],
                 width=bar_width,
                 count=4,
-                last=0,
+                last="",
             )
+            for bar in self.bars_remain:
+                bar.last_state = False
+                bar.last_key = None
+                bar.style_ok, bar.style_warn = bar_style_remain
             self.set_grid_layout_quad(
                 layout=layout_remain,
                 targets=self.bars_remain,
             )
+            self.active_metrics.append((self.bars_remain, self.metric_remain))
             self.set_primary_orient(
                 target=layout_remain,
                 column=self.wcfg["column_index_remaining"],
             )
 
             if self.wcfg["show_caption"]:
-                cap_remain = self.set_qlabel(
-                    text="brak wear",
-                    style=bar_style_desc,
-                )
-                layout_remain.addWidget(cap_remain, 0, 0, 1, 0)
+                self.set_caption(layout_remain, "brak wear", bar_style_desc)
 
         # Wear difference
-        if self.wcfg["show_wear_difference"]:
+        if show_wear_diff:
             layout_diff = self.set_grid_layout()
-            self.bar_style_diff = (
-                self.set_qss(
+            bar_style_diff = (
+                cached_qss(
                     fg_color=self.wcfg["font_color_wear_difference"],
                     bg_color=self.wcfg["bkg_color_wear_difference"]),
-                self.set_qss(
+                cached_qss(
                     fg_color=self.wcfg["font_color_warning"],
                     bg_color=self.wcfg["bkg_color_wear_difference"])
             )
             self.bars_diff = self.set_qlabel(
                 text=TEXT_NA,
-                style=self.bar_style_diff[0],
+                style=bar_style_diff[0],
                 width=bar_width,
                 count=4,
+                last="",
             )
+            for bar in self.bars_diff:
+                bar.last_state = False
+                bar.last_key = None
+                bar.style_ok, bar.style_warn = bar_style_diff
             self.set_grid_layout_quad(
                 layout=layout_diff,
                 targets=self.bars_diff,
             )
+            self.active_metrics.append((self.bars_diff, self.metric_diff))
             self.set_primary_orient(
                 target=layout_diff,
                 column=self.wcfg["column_index_wear_difference"],
             )
 
             if self.wcfg["show_caption"]:
-                cap_diff = self.set_qlabel(
-                    text="wear diff",
-                    style=bar_style_desc,
-                )
-                layout_diff.addWidget(cap_diff, 0, 0, 1, 0)
+                self.set_caption(layout_diff, "wear diff", bar_style_desc)
 
         # Estimated lifespan in laps
-        if self.wcfg["show_lifespan_laps"]:
+        if show_laps:
             layout_laps = self.set_grid_layout()
-            self.bar_style_laps = (
-                self.set_qss(
+            bar_style_laps = (
+                cached_qss(
                     fg_color=self.wcfg["font_color_lifespan_laps"],
                     bg_color=self.wcfg["bkg_color_lifespan_laps"]),
-                self.set_qss(
+                cached_qss(
                     fg_color=self.wcfg["font_color_warning"],
                     bg_color=self.wcfg["bkg_color_lifespan_laps"])
             )
             self.bars_laps = self.set_qlabel(
                 text=TEXT_NA,
-                style=self.bar_style_laps[0],
+                style=bar_style_laps[0],
                 width=bar_width,
                 count=4,
+                last="",
             )
+            for bar in self.bars_laps:
+                bar.last_state = False
+                bar.last_key = None
+                bar.style_ok, bar.style_warn = bar_style_laps
             self.set_grid_layout_quad(
                 layout=layout_laps,
                 targets=self.bars_laps,
             )
+            self.active_metrics.append((self.bars_laps, self.metric_laps))
             self.set_primary_orient(
                 target=layout_laps,
                 column=self.wcfg["column_index_lifespan_laps"],
             )
 
             if self.wcfg["show_caption"]:
-                cap_laps = self.set_qlabel(
-                    text="est. laps",
-                    style=bar_style_desc,
-                )
-                layout_laps.addWidget(cap_laps, 0, 0, 1, 0)
+                self.set_caption(layout_laps, "est. laps", bar_style_desc)
 
         # Estimated lifespan in minutes
-        if self.wcfg["show_lifespan_minutes"]:
+        if show_mins:
             layout_mins = self.set_grid_layout()
-            self.bar_style_mins = (
-                self.set_qss(
+            bar_style_mins = (
+                cached_qss(
                     fg_color=self.wcfg["font_color_lifespan_minutes"],
                     bg_color=self.wcfg["bkg_color_lifespan_minutes"]),
-                self.set_qss(
+                cached_qss(
                     fg_color=self.wcfg["font_color_warning"],
                     bg_color=self.wcfg["bkg_color_lifespan_minutes"])
             )
             self.bars_mins = self.set_qlabel(
                 text=TEXT_NA,
-                style=self.bar_style_mins[0],
+                style=bar_style_mins[0],
                 width=bar_width,
                 count=4,
+                last="",
             )
+            for bar in self.bars_mins:
+                bar.last_state = False
+                bar.last_key = None
+                bar.style_ok, bar.style_warn = bar_style_mins
             self.set_grid_layout_quad(
                 layout=layout_mins,
                 targets=self.bars_mins,
             )
+            self.active_metrics.append((self.bars_mins, self.metric_mins))
             self.set_primary_orient(
                 target=layout_mins,
                 column=self.wcfg["column_index_lifespan_minutes"],
             )
 
             if self.wcfg["show_caption"]:
-                cap_mins = self.set_qlabel(
-                    text="est. mins",
-                    style=bar_style_desc,
-                )
-                layout_mins.addWidget(cap_mins, 0, 0, 1, 0)
+                self.set_caption(layout_mins, "est. mins", bar_style_desc)
+
+        self.active_metrics = tuple(self.active_metrics)
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
+        if not self.active_metrics:
+            return
+
+        # Skip if wheel data not changed since last update
         laptime_pace = minfo.delta.lapTimePace
-        for idx in range(4):
-            brake_curr = minfo.wheels.currentBrakeThickness[idx]
-            max_thickness = minfo.wheels.maxBrakeThickness[idx]
-            est_wear = minfo.wheels.estimatedBrakeWear[idx]
-
-            if self.wcfg["show_thickness"]:
-                brake_curr *= max_thickness / 100
-                est_wear *= max_thickness / 100
-
-            # Remaining brake thickness
-            if self.wcfg["show_remaining"]:
-                if self.wcfg["show_thickness"]:
-                    threshold_remaining = self.threshold_remaining * max_thickness
-                else:
-                    threshold_remaining = self.threshold_remaining * 100
-                self.update_remain(self.bars_remain[idx], brake_curr, threshold_remaining)
-
-            # Wear differences
-            if self.wcfg["show_wear_difference"]:
-                self.update_diff(self.bars_diff[idx], est_wear)
-
-            # Estimated lifespan in laps
-            if self.wcfg["show_lifespan_laps"]:
-                wear_laps = calc.wear_lifespan_in_laps(brake_curr, est_wear)
-                self.update_laps(self.bars_laps[idx], wear_laps)
-
-            # Estimated lifespan in minutes
-            if self.wcfg["show_lifespan_minutes"]:
-                wear_mins = calc.wear_lifespan_in_mins(brake_curr, est_wear, laptime_pace)
-                self.update_mins(self.bars_mins[idx], wear_mins)
+        wheels = minfo.wheels
+        max_thickness = tuple(wheels.maxBrakeThickness)
+        snapshot = (
+            *wheels.currentBrakeThickness,
+            *max_thickness,
+            *wheels.estimatedBrakeWear,
+            laptime_pace,
+        )
+        if self.last_snapshot == snapshot:
+            return
+        self.last_snapshot = snapshot
 
-    # GUI update methods
-    def update_remain(self, target, data, threshold_remaining):
+        # Recalculate per wheel thickness scale only if max thickness changed
+        if self.show_thickness and self.last_max_thickness != max_thickness:
+            self.last_max_thickness = max_thickness
+            self.thickness_scale = tuple(value / 100 for value in max_thickness)
+            self.thresholds_remaining = tuple(
+                self.threshold_remaining * scale for scale in self.thickness_scale)
+
+        # Limit text refresh rate, warning state change still updates immediately
+        now = monotonic()
+        refresh = now - self.last_display_time >= self.display_interval
+        if refresh:
+            self.last_display_time = now
+        pending = False
+        updates = []
+        active_metrics = self.active_metrics
+
+        for idx, (brake_curr, est_wear, thickness_scale, threshold_remaining) in enumerate(zip(
+            wheels.currentBrakeThickness,
+            wheels.estimatedBrakeWear,
+            self.thickness_scale,
+            self.thresholds_remaining,
+        )):
+            brake_curr *= thickness_scale
+            est_wear *= thickness_scale
+            for bars, metric in active_metrics:
+                data, state = metric(brake_curr, est_wear, laptime_pace, threshold_remaining)
+                pending |= self.update_bar(updates, bars[idx], data, state, refresh)
+
+        # Apply all changes at once after every wheel is processed
+        for target, text, style in updates:
+            if text is not None:
+                target.setText(text)
+            if style is not None:
+                target.setStyleSheet(style)
+
+        # Recheck on next tick if any text update was deferred
+        if pending:
+            self.last_snapshot = None
+
+    # Metric methods, return (data, warning state)
+    def metric_remain(self, brake_curr, est_wear, laptime_pace, threshold_remaining):
         """Remaining brake thickness"""
-        if target.last != data:
-            target.last = data
-            target.setText(self.format_num(data))
-            target.setStyleSheet(
-                self.bar_style_remain[data <= threshold_remaining]
-            )
+        return brake_curr, brake_curr <= threshold_remaining
 
-    def update_diff(self, target, data):
+    def metric_diff(self, brake_curr, est_wear, laptime_pace, threshold_remaining):
         """Wear differences"""
-        if target.last != data:
-            target.last = data
-            target.setText(self.format_num(data))
-            target.setStyleSheet(
-                self.bar_style_diff[data > self.wcfg["warning_threshold_wear"]]
-            )
+        return est_wear, est_wear > self.threshold_wear
 
-    def update_laps(self, target, data):
+    def metric_laps(self, brake_curr, est_wear, laptime_pace, threshold_remaining):
         """Estimated lifespan in laps"""
-        if target.last != data:
-            target.last = data
-            target.setText(self.format_num(data))
-            target.setStyleSheet(
-                self.bar_style_laps[data <= self.wcfg["warning_threshold_laps"]]
-            )
+        wear_laps = calc.wear_lifespan_in_laps(brake_curr, est_wear)
+        return wear_laps, wear_laps <= self.threshold_laps
 
-    def update_mins(self, target, data):
+    def metric_mins(self, brake_curr, est_wear, laptime_pace, threshold_remaining):
         """Estimated lifespan in minutes"""
-        if target.last != data:
-            target.last = data
-            target.setText(self.format_num(data))
-            target.setStyleSheet(
-                self.bar_style_mins[data <= self.wcfg["warning_threshold_minutes"]]
-            )
+        wear_mins = calc.wear_lifespan_in_mins(brake_curr, est_wear, laptime_pace)
+        return wear_mins, wear_mins <= self.threshold_mins
+
+    # GUI update methods
+    def update_bar(self, updates, target, data, state, refresh):
+        """Queue bar text & warning state change, return True if text update deferred"""
+        style = None
+        if target.last_state != state:
+            target.last_state = state
+            style = target.style_warn if state else target.style_ok
+            refresh = True
+        # Skip formatting if positive value not changed at displayed resolution,
+        # rounded same as text format; zero & negative value always formatted
+        # to keep sign correct
+        text = None
+        key = round(data, 2) if data > 0 else None
+        if key is None or target.last_key != key:
+            text = self.format_num(data)
+            if target.last == text:
+                text = None
+            elif not refresh:
+                return True
+            else:
+                target.last = text
+            target.last_key = key
+        if text is not None or style is not None:
+            updates.append((target, text, style))
+        return False
 
     # Additional methods
+    def set_caption(self, layout, text, style):
+        """Set caption on top row of metric layout"""
+        cap_bar = self.set_qlabel(text=text, style=style)
+        layout.addWidget(cap_bar, 0, 0, 1, 0)
+
     @staticmethod
     def format_num(value):
         """Format number"""
+        if 0 < value < 9.995:  # fits 4 chars, skip slice & strip
+            return f"{value:.2f}"
         return f"{value:.2f}"[:4].strip(".")